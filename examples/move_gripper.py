@@ -25,5 +25,6 @@ if __name__ == "__main__":
         time.sleep(3.0)
         print("POS after move_percent:", g.get_position())
 
-        print("Object status:", g.get_object_status())
-        print("Fault code:", g.get_fault())
+        state = g.snapshot()   # all registers in one round trip
+        print("Object status:", state.obj)
+        print("Fault code:", state.fault)
@@ -1,3 +1,5 @@
 from .robotiq import RobotiqGripper
+from .async_robotiq import AsyncRobotiqGripper
+from .state import GripperState
 
-__all__ = ["RobotiqGripper"]
+__all__ = ["RobotiqGripper", "AsyncRobotiqGripper", "GripperState"]
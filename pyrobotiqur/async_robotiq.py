@@ -0,0 +1,298 @@
+import asyncio
+import socket
+from typing import Optional
+from pyrobotiqur.enums import GripperStatus, ObjectStatus
+from pyrobotiqur.state import GripperState
+from pyrobotiqur.robotiq import (
+    _RESET_POLL,
+    _SNAPSHOT_VARS,
+    _backoff,
+    _get_cmd,
+    _parse_get,
+    _parse_reset_poll,
+    _parse_set,
+    _percent_to_position,
+    _set_cmd,
+)
+
+
+class AsyncRobotiqGripper:
+    """
+    asyncio variant of :class:`~pyrobotiqur.RobotiqGripper`.
+
+    Same API, but every method that talks to the gripper is a coroutine, so
+    several grippers (or a gripper and a UR arm) can be driven from a single
+    event loop without one thread per device.
+    """
+
+    def __init__(self, host, port=63352, timeout=2.0):
+        """
+        :param host: IP address or hostname of the UR controller
+        :param port: TCP port used by the Robotiq URCap server (default 63352)
+        :param timeout: timeout in seconds for connecting and for each reply
+        """
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self._sock: Optional[socket.socket] = None
+        self._buf = bytearray()
+        self._lock = asyncio.Lock()
+
+    # --- low level socket helpers -------------------------------------------------
+
+    async def connect(self):
+        """Open the TCP connection to the UR controller."""
+        if self._sock is not None:
+            return
+        loop = asyncio.get_running_loop()
+        s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        s.setblocking(False)
+        try:
+            await asyncio.wait_for(loop.sock_connect(s, (self.host, self.port)),
+                                   self.timeout)
+        except BaseException:
+            s.close()
+            raise
+        try:
+            s.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        except OSError:
+            pass
+        self._sock = s
+
+    async def disconnect(self):
+        """Disconnect the TCP connection."""
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            finally:
+                self._sock = None
+                self._buf.clear()
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.disconnect()
+
+    @property
+    def is_connected(self) -> bool:
+        """Whether the TCP socket is currently open."""
+        return self._sock is not None
+
+    async def _readline(self):
+        """Return the next newline-terminated reply line from the socket."""
+        loop = asyncio.get_running_loop()
+        while True:
+            idx = self._buf.find(b"\n")
+            if idx >= 0:
+                line = bytes(self._buf[:idx + 1])
+                del self._buf[:idx + 1]
+                return line
+            chunk = await asyncio.wait_for(loop.sock_recv(self._sock, 1024),
+                                           self.timeout)
+            if not chunk:
+                raise ConnectionError("Socket connection closed by the remote host")
+            self._buf += chunk
+
+    async def _exchange(self, data, count):
+        """
+        Send an already encoded, newline-terminated payload and return the
+        ``count`` raw reply lines as bytes. A reply timeout or cancellation
+        disconnects.
+        """
+        if self._sock is None:
+            raise RuntimeError("Socket not connected. Call connect() first.")
+        loop = asyncio.get_running_loop()
+        async with self._lock:
+            try:
+                await loop.sock_sendall(self._sock, data)
+                return [await self._readline() for _ in range(count)]
+            except (asyncio.TimeoutError, asyncio.CancelledError):
+                # Replies still in flight would be read as the answers to
+                # the next request, so this connection cannot be used again
+                await self.disconnect()
+                raise
+
+    # --- variables API (GET / SET) -----------------------------------------------
+
+    async def get_var(self, name):
+        """
+        Read a gripper variable, e.g. POS, SPE, FOR, OBJ, STA, FLT, ...
+
+        :returns: integer value reported by the URCap server
+        """
+        resps = await self._exchange(_get_cmd(name), 1)
+        return _parse_get(name, resps[0])
+
+    async def get_vars(self, names):
+        """
+        Read several gripper variables with a single request/response exchange.
+
+        :returns: dict mapping each variable name to its integer value
+        """
+        data = b"".join(_get_cmd(name) for name in names)
+        resps = await self._exchange(data, len(names))
+        return {name: _parse_get(name, resp) for name, resp in zip(names, resps)}
+
+    async def set_var(self, name, value):
+        """
+        Write a gripper variable, e.g. POS, SPE, FOR, GTO, ACT, ...
+
+        :returns: None, raises if the server does not reply with 'ack'
+        """
+        resps = await self._exchange(_set_cmd(name, value), 1)
+        _parse_set(name, resps[0])
+
+    # --- convenience wrappers for common variables --------------------------------
+
+    async def get_position(self):
+        """Current finger position (0 = open, 255 = closed)."""
+        return await self.get_var("POS")
+
+    async def get_requested_position(self):
+        """Echo of last commanded position (PRE)."""
+        return await self.get_var("PRE")
+
+    async def get_status(self):
+        """High-level gripper status (RESET, ACTIVATING, ACTIVE, ...)."""
+        return GripperStatus(await self.get_var("STA"))
+
+    async def get_object_status(self):
+        """Object status (MOVING, contact while opening/closing, at destination)."""
+        return ObjectStatus(await self.get_var("OBJ"))
+
+    async def get_fault(self):
+        """Fault code (0 = OK, see Robotiq manual for full list)."""
+        return await self.get_var("FLT")
+
+    async def snapshot(self):
+        """Position, requested position, status, object status and fault in one round trip."""
+        vals = await self.get_vars(_SNAPSHOT_VARS)
+        return GripperState(
+            position=vals["POS"],
+            requested=vals["PRE"],
+            status=GripperStatus(vals["STA"]),
+            obj=ObjectStatus(vals["OBJ"]),
+            fault=vals["FLT"],
+        )
+
+    # --- higher-level motion primitives -------------------------------------------
+
+    async def reset(self, poll_interval=0.1, timeout=5.0):
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        while True:
+            # SET ACT 0, SET ATR 0, GET ACT, GET STA in one round trip
+            if _parse_reset_poll(await self._exchange(_RESET_POLL, 4)):
+                break
+
+            if timeout is not None and (loop.time() - start) > timeout:
+                raise TimeoutError("Gripper reset did not complete within timeout")
+
+            await asyncio.sleep(poll_interval)
+
+    async def activate(self, wait=True, poll_interval=0.1, strict=False):
+        """
+        Activate the gripper.
+
+        This will:
+          * return right away if the gripper already reports STA == ACTIVE
+          * reset the gripper if needed
+          * set ACT = 1
+          * optionally wait until STA == ACTIVE
+
+        :param strict: always reset/activate and confirm both ACT and STA,
+                       as needed when another client may be writing ACT
+                       concurrently; otherwise the acknowledged ACT = 1 is
+                       trusted and only STA is polled
+        """
+        status = await self.get_status()
+        if status == GripperStatus.ACTIVE and not strict:
+            return
+
+        # If not already active, go through reset procedure
+        if status != GripperStatus.ACTIVE:
+            await self.reset(poll_interval=poll_interval)
+
+        # Request activation
+        await self.set_var("ACT", 1)
+
+        if not wait:
+            return
+        if strict:
+            # Wait until activation completed (ACT=1 and STA=3)
+            while True:
+                vals = await self.get_vars(["ACT", "STA"])
+                if vals["ACT"] == 1 and GripperStatus(vals["STA"]) == GripperStatus.ACTIVE:
+                    break
+                await asyncio.sleep(poll_interval)
+        else:
+            # ACT = 1 was just acknowledged, only STA still has to change
+            while await self.get_status() != GripperStatus.ACTIVE:
+                await asyncio.sleep(poll_interval)
+
+    async def move(self, position, speed=128, force=128,
+                   wait=True, poll_interval=0.01):
+        """
+        Move gripper fingers to a position with given speed and force.
+
+        :param position: 0-255 (0 = fully open, 255 = fully closed)
+        :param speed:    0-255 (0 = slowest, 255 = fastest)
+        :param force:    0-255 (0 = minimum, 255 = maximum)
+        :param wait:     if True, wait until motion is finished
+        :param poll_interval: upper bound for the sleep between status polls;
+                         polling starts at a tenth of it and backs off
+        :returns: GripperState snapshot after the motion if wait=True (unpacks
+                  as (final_position, ObjectStatus)), otherwise the tuple
+                  (requested_position, ObjectStatus.MOVING)
+        """
+        position = max(0, min(255, int(position)))
+        speed = max(0, min(255, int(speed)))
+        force = max(0, min(255, int(force)))
+
+        # Program motion in a single write (POS, SPE, FOR, then go-to start)
+        names = ["POS", "SPE", "FOR", "GTO"]
+        values = [position, speed, force, 1]
+        data = b"".join(_set_cmd(n, v) for n, v in zip(names, values))
+        for name, resp in zip(names, await self._exchange(data, len(names))):
+            _parse_set(name, resp)
+
+        if not wait:
+            return position, ObjectStatus.MOVING
+
+        delays = _backoff(poll_interval)
+        while await self.get_requested_position() != position:
+            await asyncio.sleep(next(delays))
+
+        delays = _backoff(poll_interval)
+        obj = await self.get_object_status()
+        while obj == ObjectStatus.MOVING:
+            await asyncio.sleep(next(delays))
+            obj = await self.get_object_status()
+
+        return await self.snapshot()
+
+    async def open(self, speed=128, force=1,
+                   wait=True, poll_interval=0.01):
+        """Fully open the gripper."""
+        return await self.move(0, speed=speed, force=force, wait=wait,
+                               poll_interval=poll_interval)
+
+    async def close(self, speed=128, force=128,
+                    wait=True, poll_interval=0.01):
+        """Fully close the gripper."""
+        return await self.move(255, speed=speed, force=force, wait=wait,
+                               poll_interval=poll_interval)
+
+    async def move_percent(self, percent, speed=128, force=128,
+                           wait=True, poll_interval=0.01):
+        """
+        Move gripper to a position specified in percent.
+
+        :param percent: 0-100  (0% = fully open, 100% = fully closed)
+        :returns: same as :meth:`move`
+        """
+        return await self.move(_percent_to_position(percent), speed=speed,
+                               force=force, wait=wait, poll_interval=poll_interval)
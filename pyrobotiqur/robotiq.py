@@ -1,10 +1,192 @@
+import contextlib
+import select
 import socket
 import threading
 import time
-from typing import Optional
+from typing import Any, ContextManager, Dict, List, Optional, Tuple, final
 from pyrobotiqur.enums import GripperStatus, ObjectStatus
+from pyrobotiqur.state import GripperState
 
 
+# Variables with pre-encoded GET commands / SET templates
+_KNOWN_VARS = ("POS", "STA", "ACT", "OBJ", "PRE", "FLT", "ATR", "SPE", "FOR", "GTO")
+
+_GET_CMDS: Dict[str, bytes] = {n: ("GET " + n + "\n").encode("ascii") for n in _KNOWN_VARS}
+_SET_FMTS: Dict[str, bytes] = {n: ("SET " + n + " %d\n").encode("ascii") for n in _KNOWN_VARS}
+_GET_PREFIXES: Dict[str, bytes] = {n: (n + " ").encode("ascii") for n in _KNOWN_VARS}
+
+
+# One reset poll: clear ACT/ATR and read back ACT/STA in a single round trip
+_RESET_POLL = _SET_FMTS["ACT"] % 0 + _SET_FMTS["ATR"] % 0 + _GET_CMDS["ACT"] + _GET_CMDS["STA"]
+
+# Registers read by snapshot()
+_SNAPSHOT_VARS = ["POS", "PRE", "STA", "OBJ", "FLT"]
+
+# Blocks server-side until the object status leaves MOVING (newer URCaps only)
+_WAIT_OBJ = b"WAIT OBJ != 0\n"
+
+
+def _readable_now(sock: socket.socket) -> bool:
+    """Whether ``sock`` has data (or EOF) to read, checked without waiting."""
+    if hasattr(select, "poll"):
+        # select() fails for descriptors >= FD_SETSIZE (1024) on POSIX
+        poller = select.poll()
+        poller.register(sock, select.POLLIN)
+        return bool(poller.poll(0))
+    readable, _, _ = select.select([sock], [], [], 0)
+    return bool(readable)
+
+
+@final
+class _Connection:
+    """
+    An open connection to the URCap server: the socket, its buffered
+    reader/writer, the acks still owed for unverified SETs and the lock that
+    keeps request/reply pairs together. Grippers created with
+    share_connection=True all use the same instance for a (host, port).
+    """
+
+    def __init__(self, sock: socket.socket, lock: ContextManager[Any]):
+        self.sock = sock
+        # Buffered file wrappers frame replies on newlines even when a reply
+        # is split across several TCP segments
+        self.rfile: Any = sock.makefile("rb")
+        self.wfile: Any = sock.makefile("wb")
+        self.pending_acks = 0
+        self.lock = lock
+        self.closed = False
+
+    def is_alive(self) -> bool:
+        """Whether the connection is open and has not been closed by the remote side."""
+        if self.closed:
+            return False
+        try:
+            # A socket with a timeout would wait in recv() even with
+            # MSG_DONTWAIT, so check readiness without waiting first
+            if not _readable_now(self.sock):
+                return True  # alive, just nothing to read
+            return self.sock.recv(1, socket.MSG_PEEK) != b""
+        except (OSError, ValueError):
+            # ValueError: polling an already closed socket
+            return False
+
+    def close(self) -> None:
+        """Close the reader/writer and the socket, for every gripper using it."""
+        self.closed = True
+        for f in (self.rfile, self.wfile):
+            try:
+                f.close()
+            except OSError:
+                # writer flush on a broken connection; the socket is closed next
+                pass
+        # Only closes the descriptor once no file wrapper refers to it any more
+        self.sock.close()
+
+
+# Process-wide cache of open controller connections, keyed by (host, port),
+# used by grippers created with share_connection=True
+_connection_cache: Dict[Tuple[str, int], _Connection] = {}
+_connection_cache_lock = threading.Lock()
+
+
+def _get_cmd(name: str) -> bytes:
+    """Encoded "GET <name>" command, from the cache for known variables."""
+    cmd = _GET_CMDS.get(name)
+    if cmd is None:
+        cmd = "GET {}\n".format(name).encode("ascii")
+    return cmd
+
+
+def _set_cmd(name: str, value: Any) -> bytes:
+    """Encoded "SET <name> <value>" command, from the cache for known variables."""
+    fmt = _SET_FMTS.get(name)
+    if fmt is None:
+        fmt = "SET {} %d\n".format(name).encode("ascii")
+    return fmt % int(value)
+
+
+def _is_ack(resp: bytes) -> bool:
+    """Whether a raw reply line is the server's 'ack', without copying it in the common case."""
+    return resp == b"ack\n" or resp.strip() == b"ack"
+
+
+def _parse_get(name: str, resp: bytes) -> int:
+    """Parse a GET reply of the form b"<NAME> <value>", e.g. b"POS 123"."""
+    prefix = _GET_PREFIXES.get(name)
+    if prefix is None:
+        prefix = (name + " ").encode("ascii")
+    if resp.startswith(prefix):
+        # int() skips the trailing newline itself, so only one slice is made
+        try:
+            return int(resp[len(prefix):])
+        except ValueError:
+            pass
+    raise ValueError("Unexpected response '{}' when reading {}".format(
+        resp.decode("ascii", "replace").strip(), name))
+
+
+def _parse_set(name: str, resp: bytes) -> None:
+    """Check a SET reply, raising if the server did not answer 'ack'."""
+    if not _is_ack(resp):
+        raise RuntimeError("SET {} failed, server replied '{}'".format(
+            name, resp.decode("ascii", "replace").strip()))
+
+
+def _check_open(conn: _Connection) -> None:
+    """Raise if ``conn`` was closed, e.g. by another gripper sharing it."""
+    if conn.closed:
+        raise ConnectionError("Socket connection has been closed")
+
+
+def _sendmsg_batch(sock: Any, parts: List[bytes]) -> None:
+    """
+    Write several buffers with a single scatter-gather ``sendmsg`` call,
+    without joining them first. Falls back to ``sendall`` where ``sendmsg``
+    is unavailable (Windows).
+    """
+    sendmsg = getattr(sock, "sendmsg", None)
+    if sendmsg is None:
+        sock.sendall(b"".join(parts))
+        return
+    sent = sendmsg(parts)
+    if sent < sum(len(part) for part in parts):
+        # Rare short write: send the remainder the simple way
+        sock.sendall(b"".join(parts)[sent:])
+
+
+def _percent_to_position(percent):
+    """Map 0-100 % (clamped) to a raw 0-255 finger position."""
+    if isinstance(percent, int):
+        # Integer-only path, rounding half to even like round() below
+        q, r = divmod(max(0, min(100, percent)) * 255, 100)
+        return q + (r > 50 or (r == 50 and q & 1))
+    percent = max(0.0, min(100.0, float(percent)))
+    return int(round(percent / 100.0 * 255.0))
+
+
+def _parse_reset_poll(resps):
+    """Check the four replies to ``_RESET_POLL``; True once the gripper is reset."""
+    _parse_set("ACT", resps[0])
+    _parse_set("ATR", resps[1])
+    act = _parse_get("ACT", resps[2])
+    sta = _parse_get("STA", resps[3])
+    return act == 0 and GripperStatus(sta) == GripperStatus.RESET
+
+
+def _backoff(poll_interval):
+    """
+    Yield sleep durations for a wait loop, starting at a tenth of
+    ``poll_interval`` and doubling up to ``poll_interval``. Motions that
+    finish almost immediately are then detected after ~1 ms instead of a
+    full poll period.
+    """
+    delay = poll_interval / 10.0
+    while True:
+        yield delay
+        delay = min(delay * 2.0, poll_interval)
+
+
+@final
 class RobotiqGripper:
     """
     Simple Python interface for a Robotiq 2F / Hand-E gripper connected
@@ -14,36 +196,151 @@ class RobotiqGripper:
     port 63352) using ASCII commands like "GET POS" / "SET POS 100".
     """
 
-    def __init__(self, host, port=63352, timeout=2.0):
+    def __init__(self, host: str, port: int = 63352, timeout: float = 2.0,
+                 threadsafe: bool = False, share_connection: bool = False,
+                 use_wait: bool = False, autoreconnect: bool = False,
+                 wait_timeout: float = 10.0):
         """
         :param host: IP address or hostname of the UR controller
         :param port: TCP port used by the Robotiq URCap server (default 63352)
         :param timeout: socket timeout in seconds
+        :param threadsafe: serialize socket access with a lock; must be True
+                           if one gripper instance is shared between threads
+        :param share_connection: reuse an already open connection to the same
+                           host/port from the process-wide cache instead of
+                           opening a new one; its replies, pending acks and
+                           lock are shared by all grippers using it
+        :param use_wait: probe whether the URCap supports "WAIT OBJ != 0"
+                           (at connect time, or after the first motion) and,
+                           if so, let move() block on it instead of polling
+                           the object status
+        :param autoreconnect: check the connection before every request and
+                           transparently reconnect if it has been dropped
+        :param wait_timeout: longest time in seconds move() blocks on a
+                           server-side "WAIT OBJ != 0" before giving up
         """
         self.host = host
         self.port = port
         self.timeout = timeout
-        self._sock: Optional[socket.socket] = None
-        self._lock = threading.Lock()
+        self.share_connection = share_connection
+        self.use_wait = use_wait
+        self.wait_timeout = wait_timeout
+        self._supports_wait: Optional[bool] = None  # None: not probed yet
+        self.autoreconnect = autoreconnect
+        self._conn: Optional[_Connection] = None
+        # Reentrant: a reconnect under the lock probes the server again
+        self._lock: ContextManager[Any] = threading.RLock() if threadsafe else contextlib.nullcontext()
 
     # --- low level socket helpers -------------------------------------------------
 
     def connect(self):
         """Open the TCP connection to the UR controller."""
-        if self._sock is not None:
+        if self._conn is not None:
+            return
+        if self.share_connection:
+            self._conn = self._shared_connection()
+        else:
+            self._attach_socket(self._open_socket())
+        if self.use_wait and self._supports_wait is None:
+            self._probe_wait()
+
+    def _shared_connection(self) -> _Connection:
+        """Return the live cached connection to host/port, opening one if needed."""
+        key = (self.host, self.port)
+        with _connection_cache_lock:
+            cached = _connection_cache.get(key)
+        if cached is not None and cached.is_alive():
+            return cached
+        # Connect without holding the cache lock, which would stall every
+        # other gripper's connect() for up to the connect timeout
+        new = _Connection(self._open_socket(), threading.Lock())
+        with _connection_cache_lock:
+            cached = _connection_cache.get(key)
+            if cached is not None and cached.is_alive():
+                winner = cached  # another gripper connected in the meantime
+            else:
+                _connection_cache[key] = new
+                winner = new
+        if winner is not new:
+            new.close()
+        elif cached is not None:
+            cached.close()  # replaced a dead connection
+        return winner
+
+    def _probe_wait(self):
+        """
+        Detect whether the URCap server answers "WAIT OBJ != 0" with 'ack'.
+
+        Only probes while OBJ != 0, where a supporting server replies at once.
+        Before the first motion (OBJ == 0, e.g. not yet activated) the WAIT
+        would block, so the probe is left to the end of the next move().
+        """
+        if self.get_var("OBJ") == 0:
             return
+        try:
+            self._supports_wait = _is_ack(self._send_raw_bytes(_WAIT_OBJ))
+        except socket.timeout:
+            # No reply at all. The timed out connection has been dropped (and
+            # evicted from the shared cache) since a late reply would
+            # desynchronize the stream, so start over on a fresh one
+            self._supports_wait = False
+            self.connect()
+
+    def _open_socket(self):
+        """Create and connect a new socket to the UR controller."""
         s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         s.settimeout(self.timeout)
         s.connect((self.host, self.port))
-        self._sock = s
+        try:
+            # Send the tiny ASCII commands immediately instead of letting
+            # Nagle's algorithm hold them back waiting for the previous ACK
+            s.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            # Detect a silently dropped controller link in long-running processes
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        except OSError:
+            pass
+        return s
+
+    def _attach_socket(self, s):
+        """Use the connected socket ``s`` for all further communication."""
+        self._conn = _Connection(s, contextlib.nullcontext())
 
     def disconnect(self):
-        """Disconnect the TCP connection."""
-        if self._sock is not None:
-            try:
-                self._sock.close()
-            finally:
-                self._sock = None
+        """
+        Disconnect the TCP connection. A shared connection stays open in the
+        cache for other grippers; use :meth:`close_all` to close those.
+        """
+        conn = self._conn
+        if conn is not None:
+            self._conn = None
+            if not self.share_connection:
+                conn.close()
+
+    @classmethod
+    def close_all(cls):
+        """Close every connection in the process-wide shared connection cache."""
+        with _connection_cache_lock:
+            conns = list(_connection_cache.values())
+            _connection_cache.clear()
+        for conn in conns:
+            conn.close()
+
+    @classmethod
+    def attach(cls, fd, **kwargs):
+        """
+        Create a gripper on an already connected socket file descriptor, e.g.
+        one inherited from a parent process. The descriptor is duplicated, so
+        the caller keeps ownership of ``fd``.
+
+        :param fd: file descriptor of a TCP socket connected to the URCap server
+        :param kwargs: further constructor arguments (timeout, threadsafe, ...)
+        """
+        s = socket.fromfd(fd, socket.AF_INET, socket.SOCK_STREAM)
+        host, port = s.getpeername()[:2]
+        g = cls(host, port=port, **kwargs)
+        s.settimeout(g.timeout)
+        g._attach_socket(s)
+        return g
 
     def __enter__(self):
         self.connect()
@@ -54,48 +351,160 @@ class RobotiqGripper:
 
     @property
     def is_connected(self) -> bool:
-        """Whether the TCP socket is currently open."""
-        return self._sock is not None
+        """
+        Whether the TCP connection is open and has not been closed by the
+        remote side. Checked by peeking at the socket without waiting, so no
+        protocol round trip is needed.
+        """
+        return self._conn is not None and self._conn.is_alive()
+
+    def _ensure_connected(self) -> _Connection:
+        """
+        Return the connection, reconnecting first when autoreconnect is set;
+        raise if not connected. Caller holds the lock, so another thread
+        cannot drop the connection between this check and its use.
+        """
+        if self.autoreconnect and not self.is_connected:
+            self._drop_connection()
+            self.connect()
+        conn = self._conn
+        if conn is None:
+            raise RuntimeError("Socket not connected. Call connect() first.")
+        return conn
+
+    def _drop_connection(self) -> None:
+        """
+        Disconnect from a connection that can no longer be used, closing it
+        and removing it from the shared cache if it is shared.
+        """
+        dead = self._conn
+        self._conn = None
+        if dead is None:
+            return
+        if self.share_connection:
+            # Do not hand the dead connection out from the cache again
+            with _connection_cache_lock:
+                if _connection_cache.get((self.host, self.port)) is dead:
+                    del _connection_cache[(self.host, self.port)]
+        # Closed for every gripper sharing it, so none reads the late replies
+        dead.close()
+
+    def _exchange(self, data: bytes, count: int) -> List[bytes]:
+        """
+        Send an already encoded, newline-terminated payload in a single socket
+        write and return the ``count`` raw reply lines (trailing newline
+        included) as bytes.
+
+        The URCap server answers each command with exactly one
+        newline-terminated line, so one line is read per command. Replies
+        still owed for earlier unverified SETs come first in the stream and
+        are drained (and checked) before this payload's replies.
+        """
+        with self._lock:
+            conn = self._ensure_connected()
+            with conn.lock:
+                _check_open(conn)
+                conn.wfile.write(data)
+                conn.wfile.flush()
+                return self._read_replies(conn, count)
+
+    def _exchange_batch(self, parts: List[bytes]) -> List[bytes]:
+        """
+        Like :meth:`_exchange`, for a list of encoded commands that each end
+        with a newline; they are written with one vectored send.
+        """
+        with self._lock:
+            conn = self._ensure_connected()
+            with conn.lock:
+                _check_open(conn)
+                _sendmsg_batch(conn.sock, parts)
+                return self._read_replies(conn, len(parts))
+
+    def _read_replies(self, conn: _Connection, count: int) -> List[bytes]:
+        """
+        Read ``count`` reply lines from ``conn``, after any owed acks. Caller
+        holds the locks.
+
+        On a reply timeout the connection is dropped: the buffered reader
+        cannot be read from again, and a late reply would be taken as the
+        answer to the next command.
+        """
+        pending = conn.pending_acks
+        conn.pending_acks = 0
+        try:
+            lines: List[bytes] = []
+            for _ in range(pending + count):
+                line = conn.rfile.readline()
+                if not line:
+                    raise ConnectionError("Socket connection closed by the remote host")
+                lines.append(line)
+        except socket.timeout:
+            self._drop_connection()
+            raise
+        # The acks of earlier unverified SETs are only checked once every
+        # owed line has been read, so a failure leaves the stream in sync
+        for line in lines[:pending]:
+            if not _is_ack(line):
+                raise RuntimeError("Unverified SET failed, server replied '{}'".format(
+                    line.decode("ascii", "replace").strip()))
+        return lines[pending:]
+
+    def _send_no_reply(self, data: bytes) -> None:
+        """
+        Send one encoded SET command without waiting for its reply. The 'ack'
+        is drained and checked by the next exchange that reads from the socket.
+        """
+        with self._lock:
+            conn = self._ensure_connected()
+            with conn.lock:
+                _check_open(conn)
+                conn.wfile.write(data)
+                conn.wfile.flush()
+                conn.pending_acks += 1
+
+    def _send_raw_bytes(self, data: bytes) -> bytes:
+        """Send one encoded command (with trailing newline) and return the raw reply line."""
+        return self._exchange(data, 1)[0]
 
     def _send_raw(self, cmd):
         """
         Send a raw command string and return the raw response as a decoded string.
         Adds the trailing newline automatically.
         """
-        if self._sock is None:
-            raise RuntimeError("Socket not connected. Call connect() first.")
-        data = (cmd.strip() + "\n").encode("ascii")
-        with self._lock:
-            self._sock.sendall(data)
-            resp = self._sock.recv(1024)
-        if not resp:
-            raise ConnectionError("Socket connection closed by the remote host")
-        return resp.decode("ascii").strip()
+        return self._send_raw_bytes((cmd.strip() + "\n").encode("ascii")).decode("ascii").strip()
 
     # --- variables API (GET / SET) -----------------------------------------------
 
-    def get_var(self, name):
+    def get_var(self, name: str) -> int:
         """
         Read a gripper variable, e.g. POS, SPE, FOR, OBJ, STA, FLT, ...
 
         :returns: integer value reported by the URCap server
         """
-        resp = self._send_raw("GET {}".format(name))
-        # Expected format: "<NAME> <value>", e.g. "POS 123"
-        parts = resp.split()
-        if len(parts) != 2 or parts[0] != name:
-            raise ValueError("Unexpected response '{}' when reading {}".format(resp, name))
-        return int(parts[1])
+        return _parse_get(name, self._send_raw_bytes(_get_cmd(name)))
 
-    def set_var(self, name, value):
+    def get_vars(self, names: List[str]) -> Dict[str, int]:
+        """
+        Read several gripper variables with a single request/response exchange.
+
+        :returns: dict mapping each variable name to its integer value
+        """
+        resps = self._exchange_batch([_get_cmd(name) for name in names])
+        return {name: _parse_get(name, resp) for name, resp in zip(names, resps)}
+
+    def set_var(self, name: str, value: Any, verify: bool = True) -> None:
         """
         Write a gripper variable, e.g. POS, SPE, FOR, GTO, ACT, ...
 
+        :param verify: if False, return right after sending without waiting
+                       for the reply; the 'ack' is checked by the next
+                       request that reads from the gripper
         :returns: None, raises if the server does not reply with 'ack'
         """
-        resp = self._send_raw("SET {} {}".format(name, int(value)))
-        if resp != "ack":
-            raise RuntimeError("SET {} failed, server replied '{}'".format(name, resp))
+        if not verify:
+            self._send_no_reply(_set_cmd(name, value))
+            return
+        _parse_set(name, self._send_raw_bytes(_set_cmd(name, value)))
 
     # --- convenience wrappers for common variables --------------------------------
 
@@ -119,45 +528,69 @@ class RobotiqGripper:
         """Fault code (0 = OK, see Robotiq manual for full list)."""
         return self.get_var("FLT")
 
+    def snapshot(self):
+        """Position, requested position, status, object status and fault in one round trip."""
+        vals = self.get_vars(_SNAPSHOT_VARS)
+        return GripperState(
+            position=vals["POS"],
+            requested=vals["PRE"],
+            status=GripperStatus(vals["STA"]),
+            obj=ObjectStatus(vals["OBJ"]),
+            fault=vals["FLT"],
+        )
+
     # --- higher-level motion primitives -------------------------------------------
 
     def reset(self, poll_interval=0.1, timeout=5.0):
-        self.set_var("ACT", 0)
-        self.set_var("ATR", 0)
-
         start = time.time()
         while True:
-            act = self.get_var("ACT")
-            sta = self.get_var("STA")
-            if act == 0 and GripperStatus(sta) == GripperStatus.RESET:
+            # SET ACT 0, SET ATR 0, GET ACT, GET STA in one round trip
+            if _parse_reset_poll(self._exchange(_RESET_POLL, 4)):
                 break
 
             if timeout is not None and (time.time() - start) > timeout:
                 raise TimeoutError("Gripper reset did not complete within timeout")
 
-            self.set_var("ACT", 0)
-            self.set_var("ATR", 0)
             time.sleep(poll_interval)
 
-    def activate(self, wait=True, poll_interval=0.1):
+    def activate(self, wait=True, poll_interval=0.1, strict=False):
         """
         Activate the gripper.
 
         This will:
+          * return right away if the gripper already reports STA == ACTIVE
           * reset the gripper if needed
           * set ACT = 1
           * optionally block until STA == ACTIVE
+
+        :param strict: always reset/activate and confirm both ACT and STA,
+                       as needed when another client may be writing ACT
+                       concurrently; otherwise the acknowledged ACT = 1 is
+                       trusted and only STA is polled
         """
+        status = self.get_status()
+        if status == GripperStatus.ACTIVE and not strict:
+            return
+
         # If not already active, go through reset procedure
-        if self.get_status() != GripperStatus.ACTIVE:
+        if status != GripperStatus.ACTIVE:
             self.reset(poll_interval=poll_interval)
 
         # Request activation
         self.set_var("ACT", 1)
 
-        if wait:
+        if not wait:
+            return
+        if strict:
             # Wait until activation completed (ACT=1 and STA=3)
-            while not (self.get_var("ACT") == 1 and self.get_status() == GripperStatus.ACTIVE):
+            while True:
+                vals = self.get_vars(["ACT", "STA"])
+                if vals["ACT"] == 1 and GripperStatus(vals["STA"]) == GripperStatus.ACTIVE:
+                    break
+                time.sleep(poll_interval)
+        else:
+            # ACT = 1 was just acknowledged, only STA still has to change
+            while self.get_status() != GripperStatus.ACTIVE:
                 time.sleep(poll_interval)
 
     def move(self, position, speed=128, force=128,
@@ -169,35 +602,62 @@ class RobotiqGripper:
         :param speed:    0-255 (0 = slowest, 255 = fastest)
         :param force:    0-255 (0 = minimum, 255 = maximum)
         :param wait:     if True, block until motion is finished
-        :returns: (final_position, ObjectStatus) if wait=True,
-                  otherwise (requested_position, ObjectStatus.MOVING)
+        :param poll_interval: upper bound for the sleep between status polls;
+                         polling starts at a tenth of it and backs off
+        :returns: GripperState snapshot after the motion if wait=True (unpacks
+                  as (final_position, ObjectStatus)), otherwise the tuple
+                  (requested_position, ObjectStatus.MOVING)
         """
         # Clamp values to valid range
         position = max(0, min(255, int(position)))
         speed = max(0, min(255, int(speed)))
         force = max(0, min(255, int(force)))
 
-        # Program motion
-        self.set_var("POS", position)
-        self.set_var("SPE", speed)
-        self.set_var("FOR", force)
-        self.set_var("GTO", 1)   # go-to start
+        # Program motion in a single write (POS, SPE, FOR, then go-to start)
+        names = ("POS", "SPE", "FOR", "GTO")
+        values = (position, speed, force, 1)
+        resps = self._exchange_batch([_set_cmd(n, v) for n, v in zip(names, values)])
+        for name, resp in zip(names, resps):
+            _parse_set(name, resp)
 
         if not wait:
             return position, ObjectStatus.MOVING
 
         # Wait until the gripper has accepted the command (PRE == requested POS)
+        delays = _backoff(poll_interval)
         while self.get_requested_position() != position:
-            time.sleep(poll_interval)
+            time.sleep(next(delays))
+
+        if self._supports_wait:
+            # Let the server block until the motion is over, then read the result
+            with self._lock:
+                conn = self._ensure_connected()
+                conn.sock.settimeout(self.wait_timeout)
+                try:
+                    resp = self._send_raw_bytes(_WAIT_OBJ)
+                except socket.timeout:
+                    # The connection has been dropped, the late reply is lost
+                    raise TimeoutError("Gripper motion did not finish within wait_timeout") from None
+                finally:
+                    if not conn.closed:
+                        conn.sock.settimeout(self.timeout)
+            if not _is_ack(resp):
+                raise RuntimeError("WAIT OBJ failed, server replied '{}'".format(
+                    resp.decode("ascii", "replace").strip()))
+            return self.snapshot()
 
         # Then wait until it stops moving (OBJ != MOVING)
+        delays = _backoff(poll_interval)
         obj = self.get_object_status()
         while obj == ObjectStatus.MOVING:
+            time.sleep(next(delays))
             obj = self.get_object_status()
-            time.sleep(poll_interval)
 
-        final_pos = self.get_position()
-        return final_pos, obj
+        if self.use_wait and self._supports_wait is None:
+            # Not probed at connect time: OBJ != 0 now, so the probe cannot block
+            self._probe_wait()
+
+        return self.snapshot()
 
     def open(self, speed=128, force=1,
              wait=True, poll_interval=0.01):
@@ -220,14 +680,9 @@ class RobotiqGripper:
         :param speed:   0-255  (0 = slowest, 255 = fastest)
         :param force:   0-255  (0 = minimum, 255 = maximum)
         :param wait:    if True, block until motion is finished
-        :returns: (final_position, ObjectStatus) if wait=True,
-                  otherwise (requested_position, ObjectStatus.MOVING)
+        :returns: same as :meth:`move`
         """
-        # Clamp percentage
-        percent = max(0.0, min(100.0, float(percent)))
-
-        # Map 0–100% to 0–255
-        position = int(round(percent / 100.0 * 255.0))
+        position = _percent_to_position(percent)
 
         return self.move(position, speed=speed, force=force,
                          wait=wait, poll_interval=poll_interval)
@@ -0,0 +1,38 @@
+from dataclasses import dataclass
+from pyrobotiqur.enums import GripperStatus, ObjectStatus
+
+
+@dataclass(slots=True, eq=False)
+class GripperState:
+    """
+    Snapshot of the gripper registers, read in a single round trip.
+
+    Unpacks, indexes and compares like the ``(position, ObjectStatus)`` tuple
+    that ``move()`` used to return, so ``pos, obj = gripper.move(...)``,
+    ``gripper.move(...)[0]`` and ``gripper.move(...) == (pos, obj)`` keep
+    working.
+    """
+
+    position: int
+    requested: int
+    status: GripperStatus
+    obj: ObjectStatus
+    fault: int
+
+    def __iter__(self):
+        yield self.position
+        yield self.obj
+
+    def __len__(self):
+        return 2
+
+    def __getitem__(self, index):
+        return (self.position, self.obj)[index]
+
+    def __eq__(self, other):
+        if isinstance(other, GripperState):
+            return (self.position, self.requested, self.status, self.obj, self.fault) == \
+                (other.position, other.requested, other.status, other.obj, other.fault)
+        if isinstance(other, tuple):
+            return (self.position, self.obj) == other
+        return NotImplemented
@@ -0,0 +1,218 @@
+import asyncio
+import socket
+
+import pytest
+
+from pyrobotiqur import AsyncRobotiqGripper, GripperState
+from pyrobotiqur.enums import GripperStatus, ObjectStatus
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def socket_peer():
+    """
+    Wire async grippers to one end of a local socket pair and return the
+    other end to play the URCap server.
+    """
+    peers = []
+    ours_list = []
+
+    def wire(g):
+        ours, peer = socket.socketpair()
+        ours.setblocking(False)
+        peer.settimeout(2.0)
+        g._sock = ours
+        ours_list.append(ours)
+        peers.append(peer)
+        return peer
+
+    yield wire
+
+    for s in ours_list + peers:
+        s.close()
+
+
+# ---------------------------------------------------------------------------
+# get_var / set_var
+# ---------------------------------------------------------------------------
+
+
+def test_get_var_parses_reply_split_across_segments(socket_peer):
+    g = AsyncRobotiqGripper("10.0.0.1")
+    peer = socket_peer(g)
+    peer.sendall(b"PO")
+    peer.sendall(b"S 123\n")
+
+    assert asyncio.run(g.get_var("POS")) == 123
+    assert peer.recv(1024) == b"GET POS\n"
+
+
+def test_get_vars_reads_all_names_in_one_batch(socket_peer):
+    g = AsyncRobotiqGripper("10.0.0.1")
+    peer = socket_peer(g)
+    peer.sendall(b"ACT 1\nSTA 3\n")
+
+    assert asyncio.run(g.get_vars(["ACT", "STA"])) == {"ACT": 1, "STA": 3}
+    assert peer.recv(1024) == b"GET ACT\nGET STA\n"
+
+
+def test_set_var_raises_on_non_ack(socket_peer):
+    g = AsyncRobotiqGripper("10.0.0.1")
+    peer = socket_peer(g)
+    peer.sendall(b"nack\n")
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(g.set_var("POS", 42))
+
+
+def test_exchange_raises_if_not_connected():
+    g = AsyncRobotiqGripper("10.0.0.1")
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(g.get_var("POS"))
+
+
+def test_reply_timeout_disconnects(socket_peer):
+    g = AsyncRobotiqGripper("10.0.0.1", timeout=0.01)
+    peer = socket_peer(g)
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(g.get_var("POS"))
+
+    # the late reply can no longer be taken as the answer to the next request
+    assert g.is_connected is False
+    assert peer.recv(1024) == b"GET POS\n"
+    assert peer.recv(1024) == b""
+    with pytest.raises(RuntimeError):
+        asyncio.run(g.get_var("PRE"))
+
+
+def test_cancelled_exchange_disconnects(socket_peer):
+    g = AsyncRobotiqGripper("10.0.0.1")
+    peer = socket_peer(g)
+
+    async def cancel_mid_exchange():
+        task = asyncio.ensure_future(g.get_var("POS"))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(cancel_mid_exchange())
+    assert peer.recv(1024) == b"GET POS\n"
+
+    assert g.is_connected is False
+    assert len(g._buf) == 0
+
+
+def test_exchange_raises_if_remote_closed(socket_peer):
+    g = AsyncRobotiqGripper("10.0.0.1")
+    peer = socket_peer(g)
+    peer.shutdown(socket.SHUT_WR)
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(g.get_var("POS"))
+
+
+# ---------------------------------------------------------------------------
+# motion primitives
+# ---------------------------------------------------------------------------
+
+
+def test_move_programs_motion_in_one_write_and_waits(socket_peer):
+    g = AsyncRobotiqGripper("10.0.0.1")
+    peer = socket_peer(g)
+    peer.sendall(b"ack\nack\nack\nack\n"
+                 b"PRE 0\nPRE 128\n"
+                 b"OBJ 0\nOBJ 3\n"
+                 b"POS 127\nPRE 128\nSTA 3\nOBJ 3\nFLT 0\n")
+
+    result = asyncio.run(g.move(128, speed=100, force=50, poll_interval=0.0))
+
+    assert result == GripperState(127, 128, GripperStatus.ACTIVE, ObjectStatus.AT_DEST, 0)
+    assert tuple(result) == (127, ObjectStatus.AT_DEST)
+    sent = peer.recv(4096)
+    assert sent.startswith(b"SET POS 128\nSET SPE 100\nSET FOR 50\nSET GTO 1\n")
+
+
+def test_move_percent_nowait_returns_immediately(socket_peer):
+    g = AsyncRobotiqGripper("10.0.0.1")
+    peer = socket_peer(g)
+    peer.sendall(b"ack\nack\nack\nack\n")
+
+    result = asyncio.run(g.move_percent(50, wait=False))
+
+    assert result == (128, ObjectStatus.MOVING)
+    assert peer.recv(4096) == b"SET POS 128\nSET SPE 128\nSET FOR 128\nSET GTO 1\n"
+
+
+def test_activate_resets_then_waits_for_active(socket_peer):
+    g = AsyncRobotiqGripper("10.0.0.1")
+    peer = socket_peer(g)
+    peer.sendall(b"STA 0\n"                 # get_status
+                 b"ack\nack\n"              # reset: ACT 0, ATR 0
+                 b"ACT 0\nSTA 0\n"          # reset poll
+                 b"ack\n"                   # ACT 1
+                 b"STA 1\n"                 # still activating
+                 b"STA 3\n")                # active
+
+    asyncio.run(g.activate(poll_interval=0.0))
+    assert peer.recv(4096).endswith(b"SET ACT 1\nGET STA\nGET STA\n")
+
+
+def test_activate_strict_confirms_act_and_sta(socket_peer):
+    g = AsyncRobotiqGripper("10.0.0.1")
+    peer = socket_peer(g)
+    peer.sendall(b"STA 3\n"                 # already active
+                 b"ack\n"                   # ACT 1
+                 b"ACT 1\nSTA 3\n")
+
+    asyncio.run(g.activate(poll_interval=0.0, strict=True))
+    assert peer.recv(4096) == b"GET STA\nSET ACT 1\nGET ACT\nGET STA\n"
+
+
+def test_activate_returns_immediately_if_already_active(socket_peer):
+    g = AsyncRobotiqGripper("10.0.0.1")
+    peer = socket_peer(g)
+    peer.sendall(b"STA 3\n")
+
+    asyncio.run(g.activate())
+    assert peer.recv(4096) == b"GET STA\n"
+
+
+def test_reset_raises_after_timeout(socket_peer):
+    g = AsyncRobotiqGripper("10.0.0.1")
+    peer = socket_peer(g)
+    peer.sendall(b"ack\nack\nACT 1\nSTA 3\n")
+
+    with pytest.raises(TimeoutError):
+        asyncio.run(g.reset(poll_interval=0.0, timeout=-1.0))
+
+
+# ---------------------------------------------------------------------------
+# connect / disconnect
+# ---------------------------------------------------------------------------
+
+
+def test_context_manager_connects_and_disconnects():
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.bind(("127.0.0.1", 0))
+    server.listen(1)
+    host, port = server.getsockname()
+
+    async def run():
+        async with AsyncRobotiqGripper(host, port=port) as g:
+            assert g.is_connected is True
+            await g.connect()  # no-op when already connected
+        return g
+
+    try:
+        g = asyncio.run(run())
+    finally:
+        server.close()
+
+    assert g.is_connected is False
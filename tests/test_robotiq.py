@@ -1,8 +1,13 @@
+import contextlib
+import os
 import socket
+import threading
+
 import pytest
 
-from pyrobotiqur import RobotiqGripper
+from pyrobotiqur import GripperState, RobotiqGripper
 from pyrobotiqur.enums import ObjectStatus, GripperStatus
+from pyrobotiqur.robotiq import _Connection, _backoff, _percent_to_position, _sendmsg_batch
 
 
 # ---------------------------------------------------------------------------
@@ -20,6 +25,43 @@ class CallRecorder:
         self.calls.append((args, kwargs))
 
 
+class BatchRecorder:
+    """Fake ``_exchange_batch`` that records encoded commands and acks every one of them."""
+
+    def __init__(self):
+        self.batches = []
+
+    def __call__(self, parts):
+        self.batches.append(list(parts))
+        return [b"ack\n"] * len(parts)
+
+
+@pytest.fixture
+def socket_peer():
+    """
+    Wire grippers to one end of a local socket pair, exactly as connect()
+    would, and return the other end to play the URCap server.
+    """
+    grippers = []
+    peers = []
+
+    def wire(g):
+        ours, peer = socket.socketpair()
+        ours.settimeout(2.0)
+        peer.settimeout(2.0)
+        g._attach_socket(ours)
+        grippers.append(g)
+        peers.append(peer)
+        return peer
+
+    yield wire
+
+    for g in grippers:
+        g.disconnect()
+    for peer in peers:
+        peer.close()
+
+
 # ---------------------------------------------------------------------------
 # get_var / set_var tests
 # ---------------------------------------------------------------------------
@@ -28,52 +70,143 @@ class CallRecorder:
 def test_get_var_parses_valid_response(monkeypatch):
     g = RobotiqGripper("127.0.0.1")
 
-    def fake_send_raw(cmd: str) -> str:
-        # we expect to be called with "GET POS"
-        assert cmd == "GET POS"
-        return "POS 123"
+    def fake_send_raw_bytes(data: bytes) -> bytes:
+        # we expect to be called with the pre-encoded "GET POS" command
+        assert data == b"GET POS\n"
+        return b"POS 123"
 
-    monkeypatch.setattr(g, "_send_raw", fake_send_raw)
+    monkeypatch.setattr(g, "_send_raw_bytes", fake_send_raw_bytes)
 
     value = g.get_var("POS")
     assert value == 123
 
 
+def test_get_var_encodes_unknown_variable(monkeypatch):
+    g = RobotiqGripper("127.0.0.1")
+
+    sent = []
+
+    def fake_send_raw_bytes(data: bytes) -> bytes:
+        sent.append(data)
+        return b"XYZ 7"
+
+    monkeypatch.setattr(g, "_send_raw_bytes", fake_send_raw_bytes)
+
+    assert g.get_var("XYZ") == 7
+    assert sent == [b"GET XYZ\n"]
+
+
 def test_get_var_raises_on_malformed_response(monkeypatch):
     g = RobotiqGripper("127.0.0.1")
 
-    def fake_send_raw(cmd: str) -> str:
-        return "ERR"  # malformed, no value
+    def fake_send_raw_bytes(data: bytes) -> bytes:
+        return b"ERR"  # malformed, no value
 
-    monkeypatch.setattr(g, "_send_raw", fake_send_raw)
+    monkeypatch.setattr(g, "_send_raw_bytes", fake_send_raw_bytes)
 
     with pytest.raises(ValueError):
         g.get_var("POS")
 
 
+@pytest.mark.parametrize("reply", [b"POSX 1\n", b"POS\n", b"POS abc\n", b"POS 1 2\n", b"PRE 1\n"])
+def test_get_var_rejects_malformed_replies(monkeypatch, reply):
+    g = RobotiqGripper("127.0.0.1")
+
+    monkeypatch.setattr(g, "_send_raw_bytes", lambda data: reply)
+
+    with pytest.raises(ValueError) as excinfo:
+        g.get_var("POS")
+
+    assert "when reading POS" in str(excinfo.value)
+
+
+def test_get_vars_reads_all_names_in_one_batch(monkeypatch):
+    g = RobotiqGripper("127.0.0.1")
+
+    batches = []
+
+    def fake_exchange_batch(parts):
+        batches.append(list(parts))
+        return [b"ACT 1", b"STA 3"]
+
+    monkeypatch.setattr(g, "_exchange_batch", fake_exchange_batch)
+
+    assert g.get_vars(["ACT", "STA"]) == {"ACT": 1, "STA": 3}
+    assert batches == [[b"GET ACT\n", b"GET STA\n"]]
+
+
+def test_snapshot_reads_full_state_in_one_batch(socket_peer):
+    g = RobotiqGripper("10.0.0.1")
+    peer = socket_peer(g)
+    peer.sendall(b"POS 12\nPRE 15\nSTA 3\nOBJ 1\nFLT 5\n")
+
+    state = g.snapshot()
+
+    assert peer.recv(1024) == b"GET POS\nGET PRE\nGET STA\nGET OBJ\nGET FLT\n"
+    assert state.position == 12
+    assert state.requested == 15
+    assert state.status is GripperStatus.ACTIVE
+    assert state.obj is ObjectStatus.STOPPED_OUTER_OBJECT
+    assert state.fault == 5
+    pos, obj = state
+    assert (pos, obj) == (12, ObjectStatus.STOPPED_OUTER_OBJECT)
+
+
+def test_gripper_state_behaves_like_legacy_move_tuple():
+    state = GripperState(200, 200, GripperStatus.ACTIVE, ObjectStatus.AT_DEST, 0)
+
+    pos, obj = state
+    assert (pos, obj) == (200, ObjectStatus.AT_DEST)
+    assert len(state) == 2
+    assert state[0] == 200 and state[1] == ObjectStatus.AT_DEST and state[-1] == obj
+    assert state == (200, ObjectStatus.AT_DEST)
+    assert (200, ObjectStatus.AT_DEST) == state
+    assert state != (201, ObjectStatus.AT_DEST)
+    assert state != GripperState(200, 200, GripperStatus.ACTIVE, ObjectStatus.AT_DEST, 1)
+
+
+def test_get_vars_raises_on_mismatched_reply(monkeypatch):
+    g = RobotiqGripper("127.0.0.1")
+
+    monkeypatch.setattr(g, "_exchange_batch", lambda parts: [b"STA 3", b"ACT 1"])
+
+    with pytest.raises(ValueError):
+        g.get_vars(["ACT", "STA"])
+
+
 def test_set_var_succeeds_on_ack(monkeypatch):
     g = RobotiqGripper("127.0.0.1")
 
     sent_commands = []
 
-    def fake_send_raw(cmd: str) -> str:
-        sent_commands.append(cmd)
-        return "ack"
+    def fake_send_raw_bytes(data: bytes) -> bytes:
+        sent_commands.append(data)
+        return b"ack"
 
-    monkeypatch.setattr(g, "_send_raw", fake_send_raw)
+    monkeypatch.setattr(g, "_send_raw_bytes", fake_send_raw_bytes)
 
     g.set_var("POS", 42)
+    g.set_var("XYZ", 3.0)
 
-    assert sent_commands == ["SET POS 42"]
+    assert sent_commands == [b"SET POS 42\n", b"SET XYZ 3\n"]
+
+
+@pytest.mark.parametrize("reply", [b"ack\n", b"ack\r\n", b"ack"])
+def test_set_var_accepts_raw_ack_lines(monkeypatch, reply):
+    g = RobotiqGripper("127.0.0.1")
+
+    monkeypatch.setattr(g, "_send_raw_bytes", lambda data: reply)
+
+    g.set_var("GTO", 1)
 
 
 def test_set_var_raises_on_non_ack(monkeypatch):
     g = RobotiqGripper("127.0.0.1")
 
-    def fake_send_raw(cmd: str) -> str:
-        return "nack"
+    def fake_send_raw_bytes(data: bytes) -> bytes:
+        return b"nack"
 
-    monkeypatch.setattr(g, "_send_raw", fake_send_raw)
+    monkeypatch.setattr(g, "_send_raw_bytes", fake_send_raw_bytes)
 
     with pytest.raises(RuntimeError):
         g.set_var("POS", 42)
@@ -118,6 +251,25 @@ def test_move_percent_mapping(monkeypatch, percent, expected_pos):
     assert result_status == ObjectStatus.AT_DEST
 
 
+@pytest.mark.parametrize(
+    "percent, expected_pos",
+    [
+        (1, 3),       # 2.55 => 3
+        (33, 84),     # 84.15 => 84
+        (50.0, 128),
+        (12.5, 32),   # 31.875 => 32
+        ("75", 191),  # 191.25 => 191
+    ],
+)
+def test_percent_to_position_int_and_float_paths(percent, expected_pos):
+    assert _percent_to_position(percent) == expected_pos
+
+
+def test_percent_to_position_int_path_matches_float_rounding():
+    for percent in range(101):
+        assert _percent_to_position(percent) == _percent_to_position(float(percent))
+
+
 def test_move_percent_clamps_range(monkeypatch):
     g = RobotiqGripper("127.0.0.1")
 
@@ -146,9 +298,9 @@ def test_move_percent_clamps_range(monkeypatch):
 def test_move_waits_for_pre_and_object_status(monkeypatch):
     g = RobotiqGripper("127.0.0.1")
 
-    # Record set_var calls
-    set_recorder = CallRecorder()
-    monkeypatch.setattr(g, "set_var", set_recorder)
+    # Record batched SET commands
+    batch_recorder = BatchRecorder()
+    monkeypatch.setattr(g, "_exchange_batch", batch_recorder)
 
     # Simulate PRE (requested position) converging to target after 2 polls
     requested_positions = [0, 50, 128]  # final equals target
@@ -170,35 +322,49 @@ def test_move_waits_for_pre_and_object_status(monkeypatch):
 
     monkeypatch.setattr(g, "get_object_status", fake_get_object_status)
 
-    # Final position reported by gripper
-    monkeypatch.setattr(g, "get_position", lambda: 128)
+    # Final state reported by gripper
+    snapshot_reads = []
 
-    # Avoid real sleeping in tests
-    monkeypatch.setattr("time.sleep", lambda *_args, **_kwargs: None)
+    def fake_get_vars(names):
+        snapshot_reads.append(list(names))
+        return {"POS": 128, "PRE": 128, "STA": 3, "OBJ": 3, "FLT": 0}
+
+    monkeypatch.setattr(g, "get_vars", fake_get_vars)
 
-    final_pos, obj_status = g.move(128, speed=100, force=50, wait=True)
+    # Avoid real sleeping in tests, but record the requested delays
+    sleeps = []
+    monkeypatch.setattr("time.sleep", lambda delay: sleeps.append(delay))
 
-    # Check commands sent via set_var
-    # Expected: POS, SPE, FOR, GTO (order matters)
-    names = [call[0][0] for call in set_recorder.calls]
-    values = [call[0][1] for call in set_recorder.calls]
+    state = g.move(128, speed=100, force=50, wait=True, poll_interval=0.01)
+    final_pos, obj_status = state
 
-    assert names == ["POS", "SPE", "FOR", "GTO"]
-    assert values[0] == 128
-    assert values[1] == 100
-    assert values[2] == 50
-    assert values[3] == 1
+    # All four SET commands go out in one batch (order matters)
+    assert batch_recorder.batches == [
+        [b"SET POS 128\n", b"SET SPE 100\n", b"SET FOR 50\n", b"SET GTO 1\n"],
+    ]
 
     assert final_pos == 128
     assert obj_status == ObjectStatus.AT_DEST
+    assert state == GripperState(128, 128, GripperStatus.ACTIVE, ObjectStatus.AT_DEST, 0)
+    assert snapshot_reads == [["POS", "PRE", "STA", "OBJ", "FLT"]]
+
+    # Each wait loop starts with a short sleep and backs off towards poll_interval
+    assert sleeps == pytest.approx([0.001, 0.002, 0.001, 0.002])
+
+
+def test_backoff_doubles_up_to_poll_interval():
+    delays = _backoff(0.01)
+    assert [next(delays) for _ in range(6)] == pytest.approx(
+        [0.001, 0.002, 0.004, 0.008, 0.01, 0.01]
+    )
 
 
 def test_move_nowait_returns_immediately(monkeypatch):
     g = RobotiqGripper("127.0.0.1")
 
-    # Record set_var calls but ensure no get_* polling is done
-    set_recorder = CallRecorder()
-    monkeypatch.setattr(g, "set_var", set_recorder)
+    # Record SET commands but ensure no get_* polling is done
+    batch_recorder = BatchRecorder()
+    monkeypatch.setattr(g, "_exchange_batch", batch_recorder)
 
     get_pre = CallRecorder()
     monkeypatch.setattr(g, "get_requested_position", get_pre)
@@ -210,8 +376,8 @@ def test_move_nowait_returns_immediately(monkeypatch):
     final_pos, obj_status = g.move(position, speed=128, force=128, wait=False)
 
     # Still must send config commands
-    names = [call[0][0] for call in set_recorder.calls]
-    assert names == ["POS", "SPE", "FOR", "GTO"]
+    names = [cmd.split()[1] for cmd in batch_recorder.batches[0]]
+    assert names == [b"POS", b"SPE", b"FOR", b"GTO"]
 
     # But no polling should happen
     assert get_pre.calls == []
@@ -224,12 +390,8 @@ def test_move_nowait_returns_immediately(monkeypatch):
 def test_move_clamps_position_speed_and_force(monkeypatch):
     g = RobotiqGripper("127.0.0.1")
 
-    set_calls = []
-
-    def fake_set_var(name, value):
-        set_calls.append((name, value))
-
-    monkeypatch.setattr(g, "set_var", fake_set_var)
+    batch_recorder = BatchRecorder()
+    monkeypatch.setattr(g, "_exchange_batch", batch_recorder)
     requested_positions = [-1, 0]
 
     def fake_get_requested_position():
@@ -237,15 +399,29 @@ def test_move_clamps_position_speed_and_force(monkeypatch):
 
     monkeypatch.setattr(g, "get_requested_position", fake_get_requested_position)
     monkeypatch.setattr(g, "get_object_status", lambda: ObjectStatus.AT_DEST)
-    monkeypatch.setattr(g, "get_position", lambda: 0)
+    monkeypatch.setattr(g, "snapshot", lambda: None)
     monkeypatch.setattr("time.sleep", lambda *_args, **_kwargs: None)
 
     g.move(-50, speed=999, force=-10, wait=True, poll_interval=0.0)
 
     # Values should be clamped to [0, 255]
-    assert ("POS", 0) in set_calls
-    assert ("SPE", 255) in set_calls
-    assert ("FOR", 0) in set_calls
+    sent = batch_recorder.batches[0]
+    assert b"SET POS 0\n" in sent
+    assert b"SET SPE 255\n" in sent
+    assert b"SET FOR 0\n" in sent
+
+
+def test_move_raises_if_any_set_is_not_acked(monkeypatch):
+    g = RobotiqGripper("127.0.0.1")
+
+    monkeypatch.setattr(
+        g, "_exchange_batch", lambda parts: [b"ack\n", b"nack\n", b"ack\n", b"ack\n"]
+    )
+
+    with pytest.raises(RuntimeError) as excinfo:
+        g.move(100, wait=False)
+
+    assert "SET SPE" in str(excinfo.value)
 
 
 # ---------------------------------------------------------------------------
@@ -303,36 +479,40 @@ def test_close_calls_move_with_max_position(monkeypatch):
 def test_reset_calls_act_and_atr_until_reset(monkeypatch):
     g = RobotiqGripper("127.0.0.1")
 
-    set_recorder = CallRecorder()
-    monkeypatch.setattr(g, "set_var", set_recorder)
-
-    # Sequence of states: first loop -> not reset, second loop -> reset
-    state_sequence = [
-        {"ACT": 1, "STA": GripperStatus.ACTIVE},
-        {"ACT": 0, "STA": GripperStatus.RESET},
+    # Replies per poll: first loop -> not reset, second loop -> reset
+    polls = [
+        [b"ack\n", b"ack\n", b"ACT 1\n", b"STA 3\n"],
+        [b"ack\n", b"ack\n", b"ACT 0\n", b"STA 0\n"],
     ]
+    payloads = []
 
-    call_count = 0
+    def fake_exchange(data, count):
+        payloads.append((data, count))
+        return polls.pop(0)
 
-    def fake_get_var(name: str):
-        nonlocal call_count
-        # After two total calls (ACT/STA or just ACT twice),
-        # move to the second state (reset)
-        idx = 0 if call_count < 2 else 1
-        call_count += 1
-        return state_sequence[idx][name]
-
-    monkeypatch.setattr(g, "get_var", fake_get_var)
+    monkeypatch.setattr(g, "_exchange", fake_exchange)
 
     # Avoid real sleeping
     monkeypatch.setattr("time.sleep", lambda *_args, **_kwargs: None)
 
     g.reset()
 
-    # We should have tried to clear ACT and ATR at least once
-    names = [c[0][0] for c in set_recorder.calls]
-    assert "ACT" in names
-    assert "ATR" in names
+    # Every poll clears ACT and ATR and reads ACT/STA in one round trip
+    assert payloads == [(b"SET ACT 0\nSET ATR 0\nGET ACT\nGET STA\n", 4)] * 2
+    assert polls == []
+
+
+def test_reset_raises_if_clear_is_not_acked(monkeypatch):
+    g = RobotiqGripper("127.0.0.1")
+
+    monkeypatch.setattr(
+        g,
+        "_exchange",
+        lambda data, count: [b"ack\n", b"nack\n", b"ACT 0\n", b"STA 0\n"],
+    )
+
+    with pytest.raises(RuntimeError):
+        g.reset()
 
 
 def test_reset_raises_after_timeout(monkeypatch):
@@ -341,13 +521,10 @@ def test_reset_raises_after_timeout(monkeypatch):
     # Always report non-reset state so loop never finishes
     monkeypatch.setattr(
         g,
-        "get_var",
-        lambda name: 1 if name == "ACT" else GripperStatus.ACTIVE,
+        "_exchange",
+        lambda data, count: [b"ack\n", b"ack\n", b"ACT 1\n", b"STA 3\n"],
     )
 
-    # Prevent real socket usage
-    monkeypatch.setattr(g, "set_var", lambda *_, **__: None)
-
     # Avoid sleeping to keep test fast
     monkeypatch.setattr("time.sleep", lambda *_args, **_kwargs: None)
 
@@ -365,13 +542,12 @@ def test_activate_skips_reset_if_already_active(monkeypatch):
         lambda: GripperStatus.ACTIVE,
     )
 
-    # get_var should report ACT == 1 so the loop terminates quickly
-    def fake_get_var(name: str):
-        if name == "ACT":
-            return 1
-        raise AssertionError(f"Unexpected get_var({name}) in this test")
+    # get_vars should report ACT == 1 and STA == ACTIVE so the loop terminates quickly
+    def fake_get_vars(names):
+        assert names == ["ACT", "STA"]
+        return {"ACT": 1, "STA": GripperStatus.ACTIVE}
 
-    monkeypatch.setattr(g, "get_var", fake_get_var)
+    monkeypatch.setattr(g, "get_vars", fake_get_vars)
 
     set_recorder = CallRecorder()
     monkeypatch.setattr(g, "set_var", set_recorder)
@@ -379,13 +555,59 @@ def test_activate_skips_reset_if_already_active(monkeypatch):
     # Avoid sleeping
     monkeypatch.setattr("time.sleep", lambda *_args, **_kwargs: None)
 
-    g.activate(wait=True)
+    g.activate(wait=True, strict=True)
 
     # Ensure activation command was sent
     names = [c[0][0] for c in set_recorder.calls]
     values = [c[0][1] for c in set_recorder.calls]
     assert ("ACT" in names) and (1 in values)
 
+
+def test_activate_returns_immediately_if_already_active(monkeypatch):
+    g = RobotiqGripper("127.0.0.1")
+
+    status_calls = CallRecorder()
+
+    def fake_get_status():
+        status_calls()
+        return GripperStatus.ACTIVE
+
+    monkeypatch.setattr(g, "get_status", fake_get_status)
+
+    def fail(*_args, **_kwargs):
+        raise AssertionError("no further requests expected")
+
+    monkeypatch.setattr(g, "get_vars", fail)
+    monkeypatch.setattr(g, "set_var", fail)
+    monkeypatch.setattr(g, "reset", fail)
+
+    g.activate(wait=True)
+
+    assert len(status_calls.calls) == 1
+
+
+def test_activate_polls_only_status_after_act_is_acked(monkeypatch):
+    g = RobotiqGripper("127.0.0.1")
+
+    monkeypatch.setattr(g, "reset", CallRecorder())
+    statuses = [GripperStatus.RESET, GripperStatus.ACTIVATING, GripperStatus.ACTIVE]
+    monkeypatch.setattr(g, "get_status", lambda: statuses.pop(0))
+
+    def fail(*_args, **_kwargs):
+        raise AssertionError("ACT should not be re-read")
+
+    monkeypatch.setattr(g, "get_vars", fail)
+
+    set_rec = CallRecorder()
+    monkeypatch.setattr(g, "set_var", set_rec)
+    monkeypatch.setattr("time.sleep", lambda *_args, **_kwargs: None)
+
+    g.activate(wait=True)
+
+    assert [c[0] for c in set_rec.calls] == [("ACT", 1)]
+    assert statuses == []
+
+
 def test_activate_triggers_reset_when_inactive_and_honors_wait_false(monkeypatch):
     g = RobotiqGripper("127.0.0.1")
 
@@ -422,6 +644,7 @@ def test_connect_creates_socket_and_connects(monkeypatch):
             created["type"] = type_
             self.timeout = None
             self.connected_to = None
+            self.options = {}
 
         def settimeout(self, t):
             self.timeout = t
@@ -429,6 +652,12 @@ def test_connect_creates_socket_and_connects(monkeypatch):
         def connect(self, addr):
             self.connected_to = addr
 
+        def setsockopt(self, level, option, value):
+            self.options[(level, option)] = value
+
+        def makefile(self, mode):
+            return (self, mode)
+
     def fake_socket(family, type_):
         s = DummySocket(family, type_)
         created["instance"] = s
@@ -445,7 +674,34 @@ def test_connect_creates_socket_and_connects(monkeypatch):
     assert created["type"] == socket.SOCK_STREAM
     assert s.timeout == 1.5
     assert s.connected_to == ("10.0.0.1", 63352)
-    assert g._sock is s
+    assert s.options[(socket.IPPROTO_TCP, socket.TCP_NODELAY)] == 1
+    assert s.options[(socket.SOL_SOCKET, socket.SO_KEEPALIVE)] == 1
+    assert g._conn.rfile == (s, "rb")
+    assert g._conn.wfile == (s, "wb")
+    assert g._conn.sock is s
+
+
+def test_connect_tolerates_unsupported_socket_options(monkeypatch):
+    class DummySocket:
+        def settimeout(self, t):
+            pass
+
+        def connect(self, addr):
+            pass
+
+        def setsockopt(self, level, option, value):
+            raise OSError("option not supported")
+
+        def makefile(self, mode):
+            return None
+
+    s = DummySocket()
+    monkeypatch.setattr(socket, "socket", lambda family, type_: s)
+
+    g = RobotiqGripper("10.0.0.1")
+    g.connect()
+
+    assert g._conn.sock is s
 
 
 def test_connect_is_noop_if_already_connected(monkeypatch):
@@ -458,29 +714,61 @@ def test_connect_is_noop_if_already_connected(monkeypatch):
     monkeypatch.setattr(socket, "socket", fake_socket)
 
     g = RobotiqGripper("10.0.0.1")
-    g._sock = object()  # pretend already connected
+    g._conn = object()  # pretend already connected
 
     g.connect()
 
     assert calls == []  # no new socket created
 
 
-def test_disconnect_closes_socket_and_clears_attr():
-    class DummySocket:
-        def __init__(self):
-            self.closed = False
+class DummyFile:
+    def __init__(self, exc=None):
+        self.closed = False
+        self.exc = exc
 
-        def close(self):
-            self.closed = True
+    def close(self):
+        self.closed = True
+        if self.exc is not None:
+            raise self.exc
 
+
+class DummySocket:
+    """Socket stand-in recording close() and handing out DummyFile wrappers."""
+
+    def __init__(self, close_exc=None, wfile_exc=None):
+        self.closed = False
+        self.close_exc = close_exc
+        self.files = {"rb": DummyFile(), "wb": DummyFile(wfile_exc)}
+
+    def makefile(self, mode):
+        return self.files[mode]
+
+    def close(self):
+        self.closed = True
+        if self.close_exc is not None:
+            raise self.close_exc
+
+
+def test_disconnect_closes_socket_and_clears_attr():
     g = RobotiqGripper("10.0.0.1")
     s = DummySocket()
-    g._sock = s
+    g._attach_socket(s)
 
     g.disconnect()
 
     assert s.closed is True
-    assert g._sock is None
+    assert g._conn is None
+
+
+def test_disconnect_closes_files_even_if_flush_fails():
+    g = RobotiqGripper("10.0.0.1")
+    s = DummySocket(wfile_exc=BrokenPipeError())
+    g._attach_socket(s)
+
+    g.disconnect()
+
+    assert s.files["rb"].closed and s.files["wb"].closed and s.closed
+    assert g._conn is None
 
 
 def test_disconnect_noop_when_not_connected():
@@ -490,26 +778,147 @@ def test_disconnect_noop_when_not_connected():
 
 
 def test_disconnect_clears_attr_even_if_close_raises():
-    class DummySocket:
-        def __init__(self):
-            self.closed = False
-
-        def close(self):
-            self.closed = True
-            raise RuntimeError("boom")
-
     g = RobotiqGripper("10.0.0.1")
-    s = DummySocket()
-    g._sock = s
+    s = DummySocket(close_exc=RuntimeError("boom"))
+    g._attach_socket(s)
 
     with pytest.raises(RuntimeError):
         g.disconnect()
 
-    # Even though close raised, _sock must be cleared by finally:
-    assert g._sock is None
+    # Even though close raised, the connection must be cleared
+    assert g._conn is None
     assert s.closed is True
 
 
+@pytest.fixture
+def tcp_server():
+    """Listening TCP socket on localhost standing in for the URCap server."""
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.bind(("127.0.0.1", 0))
+    server.listen(4)
+    server.settimeout(2.0)
+    yield server
+    RobotiqGripper.close_all()
+    server.close()
+
+
+def test_shared_connection_is_reused_across_grippers(tcp_server):
+    host, port = tcp_server.getsockname()
+
+    g1 = RobotiqGripper(host, port=port, share_connection=True)
+    g2 = RobotiqGripper(host, port=port, share_connection=True)
+    g1.connect()
+    g2.connect()
+    conn, _ = tcp_server.accept()
+
+    assert g1._conn is g2._conn
+
+    # Only one connection was opened
+    tcp_server.settimeout(0.0)
+    with pytest.raises(BlockingIOError):
+        tcp_server.accept()
+
+    # disconnect() leaves the shared socket open for the other gripper
+    g1.disconnect()
+    conn.sendall(b"POS 7\n")
+    assert g2.get_var("POS") == 7
+    assert conn.recv(1024) == b"GET POS\n"
+
+    g2.disconnect()
+    RobotiqGripper.close_all()
+    assert conn.recv(1024) == b""  # closed by close_all()
+    conn.close()
+
+
+def test_connect_replaces_dead_shared_connection(monkeypatch):
+    import pyrobotiqur.robotiq as robotiq
+
+    key = ("10.0.0.1", 63352)
+    dead, dead_peer = socket.socketpair()
+    dead_peer.close()
+    monkeypatch.setitem(robotiq._connection_cache, key, _Connection(dead, threading.Lock()))
+    fresh, fresh_peer = socket.socketpair()
+    g = RobotiqGripper("10.0.0.1", share_connection=True)
+    monkeypatch.setattr(g, "_open_socket", lambda: fresh)
+
+    g.connect()
+
+    assert g._conn.sock is fresh
+    assert robotiq._connection_cache[key] is g._conn
+    assert dead.fileno() == -1
+
+    g.disconnect()
+    RobotiqGripper.close_all()
+    fresh_peer.close()
+
+
+def test_shared_connection_shares_pending_acks(tcp_server):
+    host, port = tcp_server.getsockname()
+    g1 = RobotiqGripper(host, port=port, share_connection=True)
+    g2 = RobotiqGripper(host, port=port, share_connection=True)
+    g1.connect()
+    g2.connect()
+    conn, _ = tcp_server.accept()
+
+    g1.set_var("POS", 5, verify=False)
+    conn.sendall(b"ack\nSTA 3\n")
+
+    # g2 drains the ack owed to g1 instead of taking it as its own reply
+    assert g2.get_var("STA") == 3
+    assert conn.recv(1024) == b"SET POS 5\nGET STA\n"
+    conn.close()
+
+
+def test_shared_connection_timeout_closes_it_for_every_gripper(tcp_server):
+    host, port = tcp_server.getsockname()
+    g1 = RobotiqGripper(host, port=port, timeout=0.05, share_connection=True)
+    g2 = RobotiqGripper(host, port=port, share_connection=True)
+    g3 = RobotiqGripper(host, port=port, share_connection=True, autoreconnect=True)
+    for g in (g1, g2, g3):
+        g.connect()
+    first, _ = tcp_server.accept()
+
+    with pytest.raises(socket.timeout):
+        g1.get_var("POS")
+    assert first.recv(1024) == b"GET POS\n"
+    assert first.recv(1024) == b""  # descriptor really closed
+    first.close()
+
+    # g1's late reply can no longer reach the other grippers
+    assert g2.is_connected is False
+    with pytest.raises(ConnectionError):
+        g2.get_var("STA")
+
+    def serve():
+        second, _ = tcp_server.accept()
+        with second:
+            assert second.recv(1024) == b"GET STA\n"
+            second.sendall(b"STA 3\n")
+
+    server = threading.Thread(target=serve, daemon=True)
+    server.start()
+    assert g3.get_var("STA") == 3
+    server.join(timeout=2.0)
+
+
+def test_attach_wraps_existing_socket_fd(tcp_server):
+    host, port = tcp_server.getsockname()
+    client = socket.create_connection((host, port))
+    conn, _ = tcp_server.accept()
+
+    g = RobotiqGripper.attach(client.fileno(), timeout=1.0)
+
+    assert (g.host, g.port) == (host, port)
+    assert g.timeout == 1.0
+    conn.sendall(b"ack\n")
+    g.set_var("GTO", 1)
+    assert conn.recv(1024) == b"SET GTO 1\n"
+
+    g.disconnect()
+    client.close()
+    conn.close()
+
+
 # ---------------------------------------------------------------------------
 # context manager (__enter__ / __exit__)
 # ---------------------------------------------------------------------------
@@ -550,7 +959,7 @@ def test_context_manager_disconnects_even_on_exception(monkeypatch):
 
 def test_send_raw_raises_if_not_connected():
     g = RobotiqGripper("10.0.0.1")
-    g._sock = None
+    g._conn = None
 
     with pytest.raises(RuntimeError) as excinfo:
         g._send_raw("GET POS")
@@ -558,70 +967,515 @@ def test_send_raw_raises_if_not_connected():
     assert "Socket not connected" in str(excinfo.value)
 
 
-def test_send_raw_sends_trimmed_command_and_returns_stripped_response():
+def test_send_raw_sends_trimmed_command_and_returns_stripped_response(socket_peer):
     g = RobotiqGripper("10.0.0.1")
+    peer = socket_peer(g)
+    peer.sendall(b"POS 123 \n")
 
-    class DummySocket:
-        def __init__(self):
-            self.sent_data = None
+    # Note the extra spaces – they should be stripped inside _send_raw
+    resp = g._send_raw("  GET POS  ")
 
-        def sendall(self, data):
-            self.sent_data = data
+    # Command should be trimmed and have exactly one '\n' appended
+    assert peer.recv(1024) == b"GET POS\n"
+    # Response should be decoded and stripped
+    assert resp == "POS 123"
 
-        def recv(self, bufsize):
-            # ensure buffer size matches implementation
-            assert bufsize == 1024
-            return b"POS 123 \n"
 
-        # these are unused in this test but present for completeness
-        def settimeout(self, t):  # pragma: no cover
-            pass
+def test_send_raw_raises_if_remote_closed(socket_peer):
+    g = RobotiqGripper("10.0.0.1")
+    peer = socket_peer(g)
+    peer.shutdown(socket.SHUT_WR)  # simulate remote disconnect
 
-        def connect(self, addr):  # pragma: no cover
-            pass
+    with pytest.raises(ConnectionError):
+        g._send_raw("GET POS")
 
-        def close(self):  # pragma: no cover
-            pass
 
-    s = DummySocket()
-    g._sock = s
+def test_reply_timeout_drops_connection(socket_peer):
+    g = RobotiqGripper("10.0.0.1")
+    socket_peer(g)
+    g._conn.sock.settimeout(0.01)
 
-    # Note the extra spaces – they should be stripped inside _send_raw
-    resp = g._send_raw("  GET POS  ")
+    with pytest.raises(socket.timeout):
+        g.get_var("POS")
 
-    # Command should be trimmed and have exactly one '\n' appended
-    assert s.sent_data == b"GET POS\n"
-    # Response should be decoded and stripped
-    assert resp == "POS 123"
+    assert g.is_connected is False
+    # the next call fails cleanly instead of reading from a timed out reader
+    with pytest.raises(RuntimeError) as excinfo:
+        g.get_var("POS")
+    assert "Socket not connected" in str(excinfo.value)
 
 
-def test_send_raw_raises_if_remote_closed():
+def test_autoreconnect_recovers_after_reply_timeout(socket_peer, monkeypatch):
+    g = RobotiqGripper("10.0.0.1", autoreconnect=True)
+    socket_peer(g)
+    g._conn.sock.settimeout(0.01)
+
+    with pytest.raises(socket.timeout):
+        g.get_var("POS")
+
+    fresh, fresh_peer = socket.socketpair()
+    monkeypatch.setattr(g, "_open_socket", lambda: fresh)
+    fresh_peer.sendall(b"POS 7\n")
+
+    assert g.get_var("POS") == 7
+    assert g._conn.sock is fresh
+
+    g.disconnect()
+    fresh_peer.close()
+
+
+def test_exchange_batch_sends_one_payload_and_splits_replies(socket_peer):
     g = RobotiqGripper("10.0.0.1")
+    peer = socket_peer(g)
+    # reply split across segments, plus the start of an unrelated reply
+    peer.sendall(b"ack\na")
+    peer.sendall(b"ck\nPOS")
 
-    class DummySocket:
+    resp = g._exchange_batch([b"SET POS 1\n", b"SET GTO 1\n"])
+
+    assert peer.recv(1024) == b"SET POS 1\nSET GTO 1\n"
+    assert resp == [b"ack\n", b"ack\n"]
+
+    # bytes read ahead stay buffered for the next exchange
+    peer.sendall(b" 1\n")
+    assert g.get_var("POS") == 1
+
+
+def test_unverified_set_is_acked_by_next_exchange(socket_peer):
+    g = RobotiqGripper("10.0.0.1")
+    peer = socket_peer(g)
+
+    g.set_var("POS", 10, verify=False)
+    g.set_var("SPE", 20, verify=False)
+    assert peer.recv(1024) == b"SET POS 10\nSET SPE 20\n"
+
+    # replies for both deferred SETs arrive ahead of the GET reply
+    peer.sendall(b"ack\nack\nPOS 10\n")
+    assert g.get_var("POS") == 10
+    assert g._conn.pending_acks == 0
+
+
+def test_unverified_set_failure_surfaces_on_next_exchange(socket_peer):
+    g = RobotiqGripper("10.0.0.1")
+    peer = socket_peer(g)
+
+    g.set_var("POS", 10, verify=False)
+    g.set_var("SPE", 20, verify=False)
+    g.set_var("FOR", 30, verify=False)
+    peer.sendall(b"nack\nack\nack\nPOS 5\n")
+
+    with pytest.raises(RuntimeError):
+        g.get_var("POS")
+    assert g._conn.pending_acks == 0
+
+    # the remaining acks and the GET reply were consumed with the failure
+    peer.sendall(b"PRE 10\n")
+    assert g.get_var("PRE") == 10
+
+
+def test_unverified_set_raises_if_not_connected():
+    g = RobotiqGripper("10.0.0.1")
+
+    with pytest.raises(RuntimeError):
+        g.set_var("POS", 10, verify=False)
+
+
+@pytest.mark.parametrize("reply, supported", [(b"ack\n", True), (b"nack\n", False)])
+def test_probe_wait_detects_server_support(socket_peer, reply, supported):
+    g = RobotiqGripper("10.0.0.1", use_wait=True)
+    peer = socket_peer(g)
+    peer.sendall(b"OBJ 3\n" + reply)
+
+    g._probe_wait()
+
+    assert g._supports_wait is supported
+    assert peer.recv(1024) == b"GET OBJ\nWAIT OBJ != 0\n"
+
+
+def test_probe_wait_is_deferred_while_object_status_is_zero(socket_peer):
+    g = RobotiqGripper("10.0.0.1", use_wait=True)
+    peer = socket_peer(g)
+    peer.sendall(b"OBJ 0\n")
+
+    g._probe_wait()
+
+    # a WAIT would block until the first motion, so it is not sent yet
+    assert g._supports_wait is None
+    assert peer.recv(1024) == b"GET OBJ\n"
+
+
+def test_connect_probes_wait_support(monkeypatch):
+    ours, peer = socket.socketpair()
+    ours.settimeout(2.0)
+    peer.sendall(b"OBJ 3\nack\n")
+    g = RobotiqGripper("10.0.0.1", use_wait=True)
+    monkeypatch.setattr(g, "_open_socket", lambda: ours)
+
+    g.connect()
+
+    assert g._supports_wait is True
+    assert peer.recv(1024) == b"GET OBJ\nWAIT OBJ != 0\n"
+    g.disconnect()
+    peer.close()
+
+
+def test_move_probes_wait_after_first_motion(socket_peer):
+    g = RobotiqGripper("10.0.0.1", use_wait=True)
+    peer = socket_peer(g)
+    peer.sendall(b"ack\nack\nack\nack\n"  # SET POS/SPE/FOR/GTO
+                 b"PRE 20\nOBJ 3\n"          # polled until the motion is over
+                 b"OBJ 3\nack\n"             # deferred probe
+                 b"POS 20\nPRE 20\nSTA 3\nOBJ 3\nFLT 0\n")
+
+    g.move(20, poll_interval=0.0)
+
+    assert g._supports_wait is True
+    assert b"GET OBJ\nGET OBJ\nWAIT OBJ != 0\n" in peer.recv(4096)
+
+
+def test_probe_wait_reconnects_when_server_stays_silent(socket_peer, monkeypatch):
+    g = RobotiqGripper("10.0.0.1", use_wait=True)
+    peer = socket_peer(g)
+    peer.sendall(b"OBJ 3\n")
+    g._conn.sock.settimeout(0.01)
+    old_sock = g._conn.sock
+
+    fresh, fresh_peer = socket.socketpair()
+    monkeypatch.setattr(g, "_open_socket", lambda: fresh)
+
+    g._probe_wait()
+
+    assert g._supports_wait is False
+    assert g._conn.sock is fresh
+    g.disconnect()
+    fresh_peer.close()
+    assert old_sock.fileno() == -1
+
+
+def test_probe_wait_timeout_replaces_shared_connection(monkeypatch):
+    import pyrobotiqur.robotiq as robotiq
+
+    key = ("10.0.0.1", 63352)
+    silent, silent_peer = socket.socketpair()
+    silent.settimeout(0.01)
+    silent_peer.sendall(b"OBJ 3\n")
+    fresh, fresh_peer = socket.socketpair()
+    opened = iter([silent, fresh])
+    g = RobotiqGripper("10.0.0.1", share_connection=True, use_wait=True)
+    monkeypatch.setattr(g, "_open_socket", lambda: next(opened))
+
+    g.connect()
+
+    assert g._supports_wait is False
+    assert g._conn.sock is fresh
+    assert robotiq._connection_cache[key].sock is fresh
+    assert silent.fileno() == -1
+
+    g.disconnect()
+    RobotiqGripper.close_all()
+    silent_peer.close()
+    fresh_peer.close()
+
+
+def test_move_blocks_on_server_wait_when_supported(socket_peer):
+    g = RobotiqGripper("10.0.0.1")
+    peer = socket_peer(g)
+    g._supports_wait = True
+    peer.sendall(b"ack\nack\nack\nack\n"  # SET POS/SPE/FOR/GTO
+                 b"PRE 200\n"                # command accepted
+                 b"ack\n"                    # WAIT OBJ != 0 returned
+                 b"POS 180\nPRE 200\nSTA 3\nOBJ 2\nFLT 0\n")
+
+    state = g.move(200, poll_interval=0.0)
+    assert tuple(state) == (180, ObjectStatus.STOPPED_INNER_OBJECT)
+
+    sent = peer.recv(4096)
+    assert sent.endswith(b"GET PRE\nWAIT OBJ != 0\n"
+                         b"GET POS\nGET PRE\nGET STA\nGET OBJ\nGET FLT\n")
+    assert g._conn.sock.gettimeout() == g.timeout
+
+
+def test_move_raises_if_server_wait_fails(socket_peer):
+    g = RobotiqGripper("10.0.0.1")
+    peer = socket_peer(g)
+    g._supports_wait = True
+    peer.sendall(b"ack\nack\nack\nack\nPRE 10\nnack\n")
+
+    with pytest.raises(RuntimeError):
+        g.move(10)
+
+
+def test_move_server_wait_is_bounded(socket_peer):
+    g = RobotiqGripper("10.0.0.1", wait_timeout=0.01)
+    peer = socket_peer(g)
+    g._supports_wait = True
+    peer.sendall(b"ack\nack\nack\nack\nPRE 10\n")  # WAIT OBJ never returns
+
+    with pytest.raises(TimeoutError) as excinfo:
+        g.move(10, poll_interval=0.0)
+
+    assert "wait_timeout" in str(excinfo.value)
+    assert g.is_connected is False
+
+
+def test_sendmsg_batch_writes_parts_without_joining(socket_peer):
+    g = RobotiqGripper("10.0.0.1")
+    peer = socket_peer(g)
+
+    class RecordingSocket:
+        def __init__(self, sock):
+            self.sock = sock
+            self.calls = []
+
+        def sendmsg(self, parts):
+            self.calls.append(list(parts))
+            return self.sock.sendmsg(parts)
+
+    rec = RecordingSocket(g._conn.sock)
+    _sendmsg_batch(rec, [b"GET POS\n", b"GET PRE\n"])
+
+    assert rec.calls == [[b"GET POS\n", b"GET PRE\n"]]
+    assert peer.recv(1024) == b"GET POS\nGET PRE\n"
+
+
+def test_sendmsg_batch_completes_short_writes():
+    class ShortWriteSocket:
         def __init__(self):
-            self.sent_data = None
+            self.sent = b""
+
+        def sendmsg(self, parts):
+            self.sent += parts[0][:3]
+            return 3
 
         def sendall(self, data):
-            self.sent_data = data
+            self.sent += data
 
-        def recv(self, bufsize):
-            return b""  # simulate remote disconnect
+    sock = ShortWriteSocket()
 
-    s = DummySocket()
-    g._sock = s
+    _sendmsg_batch(sock, [b"SET POS 1\n", b"SET GTO 1\n"])
 
-    with pytest.raises(ConnectionError):
-        g._send_raw("GET POS")
+    assert sock.sent == b"SET POS 1\nSET GTO 1\n"
+
+
+def test_sendmsg_batch_falls_back_to_sendall_without_sendmsg():
+    class NoSendmsgSocket:
+        def __init__(self):
+            self.sent = []
+
+        def sendall(self, data):
+            self.sent.append(data)
+
+    sock = NoSendmsgSocket()
+
+    _sendmsg_batch(sock, [b"GET POS\n", b"GET PRE\n"])
+
+    assert sock.sent == [b"GET POS\nGET PRE\n"]
+
+
+def test_lock_is_only_created_when_threadsafe():
+    assert isinstance(RobotiqGripper("10.0.0.1")._lock, contextlib.nullcontext)
+
+    lock = RobotiqGripper("10.0.0.1", threadsafe=True)._lock
+    assert isinstance(lock, type(threading.RLock()))
+
+
+def test_threadsafe_request_rechecks_connection_under_lock(socket_peer):
+    g = RobotiqGripper("10.0.0.1", threadsafe=True)
+    socket_peer(g)
+    errors = []
+
+    def request():
+        try:
+            g.get_var("POS")
+        except Exception as exc:
+            errors.append(exc)
+
+    with g._lock:
+        worker = threading.Thread(target=request)
+        worker.start()
+        # another thread's request times out and drops the connection
+        # while this one waits for the lock
+        g._drop_connection()
+    worker.join(timeout=2.0)
+
+    assert len(errors) == 1
+    assert isinstance(errors[0], RuntimeError)
+    assert "Socket not connected" in str(errors[0])
+
+
+def test_threadsafe_gripper_shared_between_threads(socket_peer):
+    # Also runs on free-threaded builds (sys._is_gil_enabled() is False),
+    # where the lock is the only thing keeping request/reply pairs together
+    g = RobotiqGripper("10.0.0.1", threadsafe=True)
+    peer = socket_peer(g)
+
+    def serve():
+        with peer.makefile("rb") as rfile, peer.makefile("wb") as wfile:
+            values = {}
+            for line in rfile:
+                cmd, name, *value = line.split()
+                if cmd == b"SET":
+                    values[name] = value[0]
+                    wfile.write(b"ack\n")
+                else:
+                    wfile.write(name + b" " + values.get(name, b"0") + b"\n")
+                wfile.flush()
+
+    server = threading.Thread(target=serve, daemon=True)
+    server.start()
+
+    errors = []
+
+    def worker(name):
+        try:
+            for i in range(200):
+                g.set_var(name, i)
+                assert g.get_var(name) == i
+        except Exception as exc:  # pragma: no cover - reported below
+            errors.append(exc)
+
+    workers = [threading.Thread(target=worker, args=(n,)) for n in ("POS", "SPE")]
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join(timeout=10.0)
+
+    assert errors == []
+    assert not any(t.is_alive() for t in workers)
+
+    peer.shutdown(socket.SHUT_RDWR)
+    server.join(timeout=2.0)
 
 
 def test_is_connected_property_reflects_socket_state():
     g = RobotiqGripper("10.0.0.1")
     assert g.is_connected is False
 
-    class DummySocket:
-        pass
+    ours, peer = socket.socketpair()
+    g._attach_socket(ours)
+    assert g.is_connected is True
+
+    ours.close()
+    peer.close()
+    assert g.is_connected is False
+
+
+def test_is_connected_detects_remote_close(socket_peer):
+    g = RobotiqGripper("10.0.0.1")
+    peer = socket_peer(g)
+
+    assert g.is_connected is True
+    peer.sendall(b"ack\n")
+    assert g.is_connected is True  # unread data does not count as closed
+
+    # peeking must not consume the pending reply
+    assert g._conn.rfile.readline() == b"ack\n"
+
+    peer.close()
+    assert g.is_connected is False
+
+
+def test_is_connected_with_high_file_descriptor():
+    # select() rejects descriptors >= 1024 on POSIX
+    resource = pytest.importorskip("resource")
+    if resource.getrlimit(resource.RLIMIT_NOFILE)[0] <= 1500:
+        pytest.skip("file descriptor limit too low")
+    ours, peer = socket.socketpair()
+    high = socket.socket(fileno=os.dup2(ours.fileno(), 1500))
+    ours.close()
+    g = RobotiqGripper("10.0.0.1")
+    g._attach_socket(high)
 
-    g._sock = DummySocket()
     assert g.is_connected is True
+    peer.close()
+    assert g.is_connected is False
+    g.disconnect()
+
+
+def test_is_connected_false_on_socket_error():
+    class ResetSocket:
+        """Readable socket whose recv() reports a connection reset."""
+
+        def __init__(self, sock):
+            self.fileno = sock.fileno
+            self.makefile = sock.makefile
+
+        def recv(self, *_args):
+            raise ConnectionResetError
+
+    ours, peer = socket.socketpair()
+    peer.sendall(b"x")
+    g = RobotiqGripper("10.0.0.1")
+    g._attach_socket(ResetSocket(ours))
+
+    assert g.is_connected is False
+    ours.close()
+    peer.close()
+
 
+def test_autoreconnect_replaces_dropped_connection(socket_peer, monkeypatch):
+    g = RobotiqGripper("10.0.0.1", autoreconnect=True)
+    peer = socket_peer(g)
+    peer.close()  # controller dropped the link
+
+    fresh, fresh_peer = socket.socketpair()
+    monkeypatch.setattr(g, "_open_socket", lambda: fresh)
+    fresh_peer.sendall(b"POS 9\n")
+
+    assert g.get_var("POS") == 9
+    assert g._conn.sock is fresh
+    assert fresh_peer.recv(1024) == b"GET POS\n"
+
+    g.disconnect()
+    fresh_peer.close()
+
+
+def test_autoreconnect_evicts_dead_shared_connection(monkeypatch):
+    import pyrobotiqur.robotiq as robotiq
+
+    g = RobotiqGripper("10.0.0.1", share_connection=True, autoreconnect=True)
+    dead, dead_peer = socket.socketpair()
+    monkeypatch.setitem(robotiq._connection_cache, ("10.0.0.1", 63352),
+                        _Connection(dead, threading.Lock()))
+    g.connect()
+    dead_peer.close()  # controller dropped the shared link
+
+    fresh, fresh_peer = socket.socketpair()
+    monkeypatch.setattr(g, "_open_socket", lambda: fresh)
+    fresh_peer.sendall(b"ack\n")
+
+    g.set_var("GTO", 1)
+
+    assert robotiq._connection_cache[("10.0.0.1", 63352)].sock is fresh
+    assert dead.fileno() == -1
+
+    g.disconnect()
+    RobotiqGripper.close_all()
+    fresh_peer.close()
+
+
+def test_no_autoreconnect_by_default(socket_peer):
+    g = RobotiqGripper("10.0.0.1")
+    peer = socket_peer(g)
+    peer.close()
+
+    with pytest.raises(ConnectionError):
+        g.get_var("POS")
+
+
+def test_compiled_build_smoke(socket_peer):
+    # No monkeypatching, so this also runs against the optional mypyc build,
+    # whose native class does not allow patching methods
+    import pyrobotiqur.robotiq as robotiq
+
+    if os.environ.get("PYROBOTIQUR_EXPECT_COMPILED"):
+        assert not robotiq.__file__.endswith(".py")
+    g = RobotiqGripper("10.0.0.1")
+    peer = socket_peer(g)
+    peer.sendall(b"ack\nPOS 7\n"
+                 b"ack\nack\nack\nack\nPRE 7\nOBJ 3\n"
+                 b"POS 7\nPRE 7\nSTA 3\nOBJ 3\nFLT 0\n")
+
+    g.set_var("SPE", 1)
+    assert g.get_var("POS") == 7
+    assert g.move(7, poll_interval=0.0) == (7, ObjectStatus.AT_DEST)